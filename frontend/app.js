@@ -6,35 +6,12 @@ let provider = null;
 let signer = null;
 let contract = null;
 let userAddress = null;
+let apiEvents = null;
 
-// Contract ABI - This should match your deployed contract
-const CONTRACT_ABI = [
-    // Events
-    "event ExpenseRecorded(address indexed user, string description, uint256 amount, uint256 timestamp)",
-    "event ParticipantAdded(address indexed participant, address indexed added_by)",
-    "event PaymentReceived(address indexed from_user, uint256 amount)",
-    "event ExpenseSettled(address indexed user, uint256 amount)",
-    
-    // View functions
-    "function get_participant_count() view returns (uint256)",
-    "function calculate_equal_split() view returns (uint256)",
-    "function get_my_balance() view returns (uint256)",
-    "function check_contract_balance() view returns (uint256)",
-    "function get_participant_at(uint256 index) view returns (address)",
-    "function is_participant(address check_address) view returns (bool)",
-    "function total_expenses() view returns (uint256)",
-    "function expense_count() view returns (uint256)",
-    "function participants(uint256) view returns (address)",
-    "function balances(address) view returns (uint256)",
-    "function owner() view returns (address)",
-    
-    // State-changing functions
-    "function record_expense(string description, uint256 amount)",
-    "function add_participant(address new_participant)",
-    "function contribute() payable",
-    "function settle_expenses()",
-    "function emergency_withdraw()"
-];
+// Optional read API (scripts/api_server.py). Leave empty to read directly from the RPC.
+const API_BASE_URL = '';
+
+// Contract ABI (CONTRACT_ABI) is loaded from abi.js, generated by scripts/build.py
 
 // Initialize the application
 document.addEventListener('DOMContentLoaded', function() {
@@ -191,6 +168,7 @@ async function loadContract() {
             
             // Refresh data
             await refreshData();
+            subscribeToApiEvents(contractAddress);
             
             showAlert('contractStatus', 'Contract loaded successfully!', 'success');
             
@@ -214,6 +192,10 @@ async function refreshData() {
         return;
     }
     
+    if (API_BASE_URL) {
+        return refreshFromApi();
+    }
+    
     try {
         showLoading(true);
         
@@ -253,25 +235,86 @@ async function refreshData() {
     }
 }
 
+// Refresh contract data from the read API (one request for the summary, one for participants)
+async function refreshFromApi() {
+    try {
+        showLoading(true);
+        
+        const groupPath = `${API_BASE_URL}/groups/${contract.address.toLowerCase()}`;
+        const [group, participants] = await Promise.all([
+            fetchJson(groupPath),
+            fetchJson(`${groupPath}/participants`)
+        ]);
+        
+        const you = participants.find(p => p.address.toLowerCase() === (userAddress || '').toLowerCase());
+        
+        // Update UI
+        document.getElementById('totalExpenses').textContent = `${ethers.utils.formatEther(group.total_expenses)} ETH`;
+        document.getElementById('expenseCount').textContent = group.expense_count.toString();
+        document.getElementById('participantCount').textContent = group.participant_count.toString();
+        document.getElementById('contractBalance').textContent = `${ethers.utils.formatEther(group.contract_balance)} ETH`;
+        document.getElementById('yourBalance').textContent = `${ethers.utils.formatEther(you ? you.balance : '0')} ETH`;
+        document.getElementById('equalSplit').textContent = `${ethers.utils.formatEther(group.equal_split)} ETH`;
+        
+        renderParticipants(participants);
+        
+    } catch (error) {
+        console.error('Error refreshing data from API:', error);
+        showAlert('contractStatus', `Failed to refresh data: ${error.message}`, 'error');
+    } finally {
+        showLoading(false);
+    }
+}
+
+// Fetch JSON; the browser revalidates with the server's ETag
+async function fetchJson(url) {
+    const response = await fetch(url);
+    if (!response.ok) {
+        throw new Error(`Read API returned ${response.status}`);
+    }
+    return response.json();
+}
+
+// Refresh when the read API reports a change to this contract
+function subscribeToApiEvents(contractAddress) {
+    if (!API_BASE_URL || typeof EventSource === 'undefined') return;
+    
+    if (apiEvents) apiEvents.close();
+    apiEvents = new EventSource(`${API_BASE_URL}/events`);
+    apiEvents.addEventListener('update', (event) => {
+        const update = JSON.parse(event.data);
+        const changed = update.changed.map(address => address.toLowerCase());
+        if (changed.includes(contractAddress.toLowerCase())) {
+            refreshFromApi();
+        }
+    });
+}
+
+// Render the participants list
+function renderParticipants(participants) {
+    const participantsList = document.getElementById('participantsList');
+    participantsList.innerHTML = '';
+    
+    for (const participant of participants) {
+        const participantItem = document.createElement('div');
+        participantItem.className = 'participant-item';
+        participantItem.innerHTML = `
+            <span class="participant-address">${participant.address}</span>
+            <span class="participant-balance">${ethers.utils.formatEther(participant.balance)} ETH</span>
+        `;
+        
+        participantsList.appendChild(participantItem);
+    }
+}
+
 // Load participants list
 async function loadParticipants(count) {
     try {
-        const participantsList = document.getElementById('participantsList');
-        participantsList.innerHTML = '';
+        const indexes = [...Array(Number(count.toString())).keys()];
+        const addresses = await Promise.all(indexes.map(i => contract.get_participant_at(i)));
+        const balances = await Promise.all(addresses.map(address => contract.balances(address)));
         
-        for (let i = 0; i < count; i++) {
-            const participantAddress = await contract.get_participant_at(i);
-            const balance = await contract.balances(participantAddress);
-            
-            const participantItem = document.createElement('div');
-            participantItem.className = 'participant-item';
-            participantItem.innerHTML = `
-                <span class="participant-address">${participantAddress}</span>
-                <span class="participant-balance">${ethers.utils.formatEther(balance)} ETH</span>
-            `;
-            
-            participantsList.appendChild(participantItem);
-        }
+        renderParticipants(addresses.map((address, i) => ({ address, balance: balances[i] })));
         
     } catch (error) {
         console.error('Error loading participants:', error);
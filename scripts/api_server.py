@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+VyperVerse Read API Server
+Serve cached group summaries to dashboard viewers over HTTP and SSE
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional, Tuple
+
+from portfolio import PortfolioReader, load_manifest, POLL_INTERVAL
+
+HOST = os.environ.get("API_HOST", "127.0.0.1")
+PORT = int(os.environ.get("API_PORT", "8000"))
+
+# Seconds between SSE keep-alive comments
+HEARTBEAT_INTERVAL = 15
+
+# Seconds to wait for the first refresh before giving up
+STARTUP_TIMEOUT = int(os.environ.get("API_STARTUP_TIMEOUT", "60"))
+
+
+def encode_group(group: Dict[str, Any], changed_block: int) -> Dict[str, Any]:
+    """Group summary with wei amounts as strings for JavaScript clients
+
+    changed_block is the poll block at which the group's state last changed;
+    it stays put while the group is quiet so the response's ETag does too.
+    """
+    participant_count = group["participant_count"]
+    return {
+        "address": group["address"],
+        "changed_block": changed_block,
+        "total_expenses": str(group["total_expenses"]),
+        "expense_count": group["expense_count"],
+        "participant_count": participant_count,
+        "contract_balance": str(group["contract_balance"]),
+        "outstanding": str(group["outstanding"]),
+        "equal_split": str(group["total_expenses"] // participant_count if participant_count else 0),
+    }
+
+
+def encode_participants(group: Dict[str, Any]) -> List[Dict[str, str]]:
+    """Participant table with wei balances as strings"""
+    return [
+        {"address": p["address"], "balance": str(p["balance"])}
+        for p in group["participants"]
+    ]
+
+
+class ResponseCache:
+    """Serialized JSON responses keyed by path, with ETags and change notification"""
+
+    def __init__(self):
+        self.responses: Dict[str, Tuple[str, bytes]] = {}
+        self.version = 0
+        self.last_update: Dict[str, Any] = {}
+        self.condition = threading.Condition()
+
+    def put(self, path: str, payload: Any):
+        """Serialize a payload once and store it under a path"""
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+        self.responses[path] = (etag, body)
+
+    def get(self, path: str) -> Optional[Tuple[str, bytes]]:
+        """Cached (etag, body) for a path"""
+        return self.responses.get(path)
+
+    def publish(self, update: Dict[str, Any]):
+        """Wake every SSE client waiting for the next update"""
+        with self.condition:
+            self.version += 1
+            self.last_update = update
+            self.condition.notify_all()
+
+    def wait(self, version: int, timeout: float) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """Block until the cache moves past a version or the timeout expires"""
+        with self.condition:
+            self.condition.wait_for(lambda: self.version != version, timeout=timeout)
+            if self.version == version:
+                return version, None
+            return self.version, self.last_update
+
+
+class CacheUpdater(threading.Thread):
+    """Background thread that polls the portfolio and rebuilds changed responses"""
+
+    def __init__(self, reader: PortfolioReader, cache: ResponseCache, interval: float = POLL_INTERVAL):
+        super().__init__(daemon=True)
+        self.reader = reader
+        self.cache = cache
+        self.interval = interval
+        self.ready = threading.Event()
+        self.error: Optional[Exception] = None
+        self.changed_block: Dict[str, int] = {}
+        self.updated_at: Optional[int] = None
+        self.stale = False
+
+    def status(self) -> Dict[str, Any]:
+        """Poll block, time of the last successful refresh, and whether it is out of date"""
+        return {
+            "block": self.reader.last_block,
+            "updated_at": self.updated_at,
+            "stale": self.stale,
+            "error": str(self.error) if self.stale else None,
+        }
+
+    def rebuild(self, changed):
+        """Re-serialize responses of groups changed by a refresh, then the summary"""
+        for address in changed:
+            self.changed_block[address] = self.reader.last_block
+            group = self.reader.groups[address]
+            key = address.lower()
+            self.cache.put(f"/groups/{key}", encode_group(group, self.changed_block[address]))
+            self.cache.put(f"/groups/{key}/participants", encode_participants(group))
+        self.rebuild_summary()
+
+    def rebuild_summary(self):
+        """Re-serialize the responses that move on every poll"""
+        status = self.status()
+        totals = self.reader.totals()
+        for key in ("total_expenses", "contract_balance", "outstanding"):
+            totals[key] = str(totals[key])
+
+        self.cache.put("/status", status)
+        self.cache.put("/groups", {
+            "status": status,
+            "totals": totals,
+            "groups": [encode_group(g, self.changed_block[a]) for a, g in self.reader.groups.items()],
+        })
+
+    async def refresh_once(self) -> bool:
+        """Run one refresh and publish the result; False if it failed"""
+        first = not self.ready.is_set()
+        was_stale = self.stale
+        try:
+            changed = await self.reader.refresh()
+        except Exception as e:
+            self.error = e
+            if first:
+                return False
+            print(f"❌ Refresh failed: {e}")
+            # Keep serving the last good data, flagged as stale
+            self.stale = True
+            self.rebuild_summary()
+            if not was_stale:
+                self.cache.publish({"block": self.reader.last_block, "changed": [], "stale": True})
+            return False
+
+        self.error = None
+        self.stale = False
+        self.updated_at = int(time.time())
+        self.rebuild(changed)
+        if changed or first or was_stale:
+            self.cache.publish({
+                "block": self.reader.last_block,
+                "changed": sorted(changed),
+                "stale": False,
+            })
+        return True
+
+    async def poll(self):
+        """Refresh forever; a failed first refresh is stored in error and stops the updater"""
+        while True:
+            started = time.time()
+            refreshed = await self.refresh_once()
+            first = not self.ready.is_set()
+            self.ready.set()
+            if first and not refreshed:
+                return
+            await asyncio.sleep(max(0, self.interval - (time.time() - started)))
+
+    def run(self):
+        asyncio.run(self.poll())
+
+
+class ReadAPIHandler(BaseHTTPRequestHandler):
+    """Serves cached responses; never touches the RPC itself"""
+
+    cache: ResponseCache = None
+
+    def send_common_headers(self):
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Cache-Control", "no-cache")
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0].rstrip("/").lower() or "/"
+
+        if path == "/events":
+            return self.stream_events()
+
+        cached = self.cache.get(path)
+        if cached is None:
+            self.send_response(404)
+            self.send_common_headers()
+            self.end_headers()
+            return
+
+        etag, body = cached
+        if_none_match = self.headers.get("If-None-Match", "")
+        if etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_common_headers()
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_common_headers()
+        self.end_headers()
+        self.wfile.write(body)
+
+    def stream_events(self):
+        """Server-sent events: one "update" event per cache refresh"""
+        # Taken before the headers go out so an update right after connecting isn't missed
+        version = self.cache.version
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_common_headers()
+        self.end_headers()
+
+        try:
+            while True:
+                version, update = self.cache.wait(version, HEARTBEAT_INTERVAL)
+                if update is None:
+                    self.wfile.write(b": keep-alive\n\n")
+                else:
+                    self.wfile.write(f"event: update\ndata: {json.dumps(update)}\n\n".encode())
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+def create_server(reader: PortfolioReader, host: str = HOST, port: int = PORT,
+                  interval: float = POLL_INTERVAL, timeout: float = STARTUP_TIMEOUT) -> ThreadingHTTPServer:
+    """Start the cache updater and build an HTTP server backed by it
+
+    Raises if the first refresh fails or doesn't finish within timeout seconds.
+    """
+    cache = ResponseCache()
+    updater = CacheUpdater(reader, cache, interval)
+    updater.start()
+    if not updater.ready.wait(timeout):
+        raise Exception(f"Initial refresh did not finish within {timeout}s")
+    if updater.error is not None:
+        raise Exception(f"Initial refresh failed: {updater.error}")
+
+    handler = type("Handler", (ReadAPIHandler,), {"cache": cache})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.updater = updater
+    return server
+
+
+def main():
+    """Main server function"""
+    if len(sys.argv) < 3:
+        print("Usage: python api_server.py <rpc_url> <manifest.json | contract_address> [...]")
+        print("Environment: API_HOST (default 127.0.0.1), API_PORT (default 8000), "
+              "API_STARTUP_TIMEOUT (default 60)")
+        sys.exit(1)
+
+    rpc_url = sys.argv[1]
+    addresses = []
+    for target in sys.argv[2:]:
+        if os.path.isfile(target):
+            addresses.extend(load_manifest(target))
+        else:
+            addresses.append(target)
+
+    try:
+        reader = PortfolioReader(rpc_url, list(dict.fromkeys(addresses)))
+        server = create_server(reader)
+        print(f"✅ Serving {len(reader.contracts)} groups on http://{HOST}:{PORT}")
+        print("Endpoints: /status, /groups, /groups/<address>, /groups/<address>/participants, /events")
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopped")
+    except Exception as e:
+        print(f"❌ Server failed: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+VyperVerse Contract Artifacts
+Load precompiled ABI, bytecode and storage layout without invoking the compiler
+"""
+
+import os
+import json
+import hashlib
+from functools import lru_cache
+from typing import Dict, Any, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ARTIFACTS_DIR = os.path.join(REPO_ROOT, "artifacts")
+INDEX_FILE = "index.json"
+DEFAULT_CONTRACT = "ExpenseSplitter_Complete"
+
+OUTPUT_FORMATS = ["abi", "bytecode", "bytecode_runtime", "method_identifiers", "layout"]
+
+
+def source_hash(source_code: str) -> str:
+    """SHA-256 of a contract source, used to detect stale artifacts"""
+    return hashlib.sha256(source_code.encode()).hexdigest()
+
+
+def compiler_version() -> str:
+    """Installed Vyper version, read without importing the compiler"""
+    from importlib.metadata import version, PackageNotFoundError
+    try:
+        return f"vyper-{version('vyper')}"
+    except PackageNotFoundError:
+        return "vyper-unknown"
+
+
+def contract_name_for(contract_path: str) -> str:
+    """Artifact name for a contract source file"""
+    return os.path.splitext(os.path.basename(contract_path))[0]
+
+
+def artifact_path(contract_name: str = DEFAULT_CONTRACT) -> str:
+    """Path of the artifact file for a contract"""
+    return os.path.join(ARTIFACTS_DIR, f"{contract_name}.json")
+
+
+@lru_cache(maxsize=None)
+def load_artifact(contract_name: str = DEFAULT_CONTRACT) -> Dict[str, Any]:
+    """Load a precompiled contract artifact"""
+    path = artifact_path(contract_name)
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Artifact not found: {path} (run: python scripts/build.py)"
+        )
+
+
+def load_abi(contract_name: str = DEFAULT_CONTRACT) -> List[Dict[str, Any]]:
+    """ABI from the precompiled artifact"""
+    return load_artifact(contract_name)["abi"]
+
+
+def load_storage_layout(contract_name: str = DEFAULT_CONTRACT) -> Dict[str, Any]:
+    """Storage variable name to slot info map from the artifact"""
+    return load_artifact(contract_name)["layout"]["storage_layout"]
+
+
+def load_index() -> Dict[str, Any]:
+    """Load the artifact index written by build.py"""
+    try:
+        with open(os.path.join(ARTIFACTS_DIR, INDEX_FILE), 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"compiler": None, "contracts": {}}
+
+
+def save_index(index: Dict[str, Any]):
+    """Write the artifact index atomically"""
+    os.makedirs(ARTIFACTS_DIR, exist_ok=True)
+    path = os.path.join(ARTIFACTS_DIR, INDEX_FILE)
+    with open(f"{path}.tmp", 'w') as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(f"{path}.tmp", path)
+
+
+def is_up_to_date(entry: Dict[str, Any], sha256: str, compiler: str) -> bool:
+    """Check an index entry against the current source and toolchain"""
+    return (
+        entry is not None
+        and entry["source_sha256"] == sha256
+        and entry["compiler"] == compiler
+        and entry["output_formats"] == OUTPUT_FORMATS
+        and os.path.exists(os.path.join(ARTIFACTS_DIR, entry["artifact"]))
+    )
+
+
+def is_artifact_current(contract_path: str) -> bool:
+    """Check the index entry for a source file the same way build.py does"""
+    try:
+        with open(contract_path, 'r') as f:
+            sha256 = source_hash(f.read())
+    except FileNotFoundError:
+        return False
+
+    entry = load_index().get("contracts", {}).get(contract_name_for(contract_path))
+    return is_up_to_date(entry, sha256, compiler_version())
+
+
+def write_artifact(contract_path: str) -> str:
+    """Compile a contract and write its artifact"""
+    from vyper import compile_code
+
+    with open(contract_path, 'r') as f:
+        source_code = f.read()
+
+    compiled = compile_code(source_code, output_formats=OUTPUT_FORMATS)
+    contract_name = contract_name_for(contract_path)
+
+    artifact = {
+        "contract_name": contract_name,
+        "source_path": os.path.relpath(os.path.abspath(contract_path), REPO_ROOT),
+        "source_sha256": source_hash(source_code),
+        "compiler": compiler_version(),
+        **{output_format: compiled[output_format] for output_format in OUTPUT_FORMATS},
+    }
+
+    os.makedirs(ARTIFACTS_DIR, exist_ok=True)
+    path = artifact_path(contract_name)
+    with open(path, 'w') as f:
+        json.dump(artifact, f, indent=2)
+        f.write("\n")
+
+    load_artifact.cache_clear()
+    return path
+
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+VyperVerse CLI Startup Benchmark
+Measure how long the scripts take to start and print their usage
+"""
+
+import os
+import sys
+import time
+import statistics
+import subprocess
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Scripts to benchmark; run without arguments they print usage and exit
+SCRIPTS = [
+    "interact.py", "deploy.py", "export_ledger.py",
+    "portfolio.py", "api_server.py", "storage_reader.py",
+]
+
+# Modules that must not be imported just to print usage
+HEAVY_MODULES = ["web3", "eth_account", "vyper"]
+
+
+def time_startup(script: str, runs: int) -> list:
+    """Wall-clock startup times for a script, in milliseconds"""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(
+            [sys.executable, os.path.join(SCRIPTS_DIR, script)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def heavy_imports(script: str) -> list:
+    """Heavy modules imported by a script before it prints usage"""
+    check = (
+        "import sys, runpy\n"
+        f"sys.argv = [{script!r}]\n"
+        "try:\n"
+        f"    runpy.run_path({os.path.join(SCRIPTS_DIR, script)!r}, run_name='__main__')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules), file=sys.stderr)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", check],
+        cwd=SCRIPTS_DIR,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+    lines = result.stderr.strip().splitlines()
+    return [m for m in lines[-1].split(",") if m] if lines else []
+
+
+def main():
+    """Main benchmark function"""
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    max_ms = float(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    failed = False
+    print(f"Startup benchmark ({runs} runs each)")
+    print("="*50)
+
+    for script in SCRIPTS:
+        timings = time_startup(script, runs)
+        median = statistics.median(timings)
+        print(f"{script:<18} min {min(timings):7.1f} ms   median {median:7.1f} ms")
+
+        imported = heavy_imports(script)
+        if imported:
+            print(f"❌ {script} imports {', '.join(imported)} at startup")
+            failed = True
+
+        if max_ms is not None and median > max_ms:
+            print(f"❌ {script} median startup exceeds {max_ms:.0f} ms")
+            failed = True
+
+    print("="*50)
+    if failed:
+        sys.exit(1)
+    print("✅ Startup within budget")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+VyperVerse Build Script
+Compile every Vyper contract in parallel, skipping sources that haven't changed
+"""
+
+import os
+import sys
+import json
+import glob
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Any, List
+
+from artifacts import (
+    ARTIFACTS_DIR, DEFAULT_CONTRACT, OUTPUT_FORMATS, REPO_ROOT,
+    artifact_path, compiler_version, contract_name_for, is_up_to_date,
+    load_abi, load_index, save_index, source_hash, write_artifact
+)
+
+CONTRACTS_DIR = os.path.join(REPO_ROOT, "contracts")
+FRONTEND_DIR = os.path.join(REPO_ROOT, "frontend")
+
+
+def find_sources(contracts_dir: str = CONTRACTS_DIR) -> List[str]:
+    """All Vyper sources under the contracts directory"""
+    sources = sorted(glob.glob(os.path.join(contracts_dir, "**", "*.vy"), recursive=True))
+
+    names = {}
+    for source in sources:
+        name = contract_name_for(source)
+        if name in names:
+            raise ValueError(f"Duplicate contract name {name}: {names[name]} and {source}")
+        names[name] = source
+    return sources
+
+
+def build(sources: List[str], force: bool = False, jobs: int = None) -> Dict[str, Any]:
+    """Compile stale sources in a process pool and update the artifact index"""
+    index = load_index()
+    compiler = compiler_version()
+    previous = index.get("contracts", {})
+    contracts = {}
+    stale = []
+
+    for source in sources:
+        with open(source, 'r') as f:
+            sha256 = source_hash(f.read())
+
+        name = contract_name_for(source)
+        entry = previous.get(name)
+        if not force and is_up_to_date(entry, sha256, compiler):
+            contracts[name] = entry
+            print(f"   ⏭️  {name} (unchanged)")
+        else:
+            stale.append((name, source, sha256))
+
+    failed = []
+    if stale:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {
+                pool.submit(write_artifact, source): (name, source, sha256)
+                for name, source, sha256 in stale
+            }
+            for future in as_completed(futures):
+                name, source, sha256 = futures[future]
+                try:
+                    path = future.result()
+                except Exception as e:
+                    print(f"   ❌ {name}: {e}")
+                    failed.append(name)
+                    continue
+
+                contracts[name] = {
+                    "source_path": os.path.relpath(source, REPO_ROOT),
+                    "source_sha256": sha256,
+                    "compiler": compiler,
+                    "output_formats": OUTPUT_FORMATS,
+                    "artifact": os.path.basename(path),
+                }
+                print(f"   ✅ {name}")
+
+    # Keep entries built earlier from other sources; drop those whose source is gone
+    built = {contract_name_for(source) for source in sources}
+    for name, entry in previous.items():
+        if name in built:
+            continue
+        if os.path.exists(os.path.join(REPO_ROOT, entry["source_path"])):
+            contracts[name] = entry
+        elif os.path.exists(artifact_path(name)):
+            os.remove(artifact_path(name))
+
+    index = {"compiler": compiler, "contracts": contracts}
+    save_index(index)
+
+    if failed:
+        raise Exception(f"Compilation failed for: {', '.join(sorted(failed))}")
+    return index
+
+
+def write_if_changed(path: str, content: str) -> bool:
+    """Write a file only when its content differs"""
+    try:
+        with open(path, 'r') as f:
+            if f.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+    with open(path, 'w') as f:
+        f.write(content)
+    return True
+
+
+def write_frontend_abi(contract_name: str = DEFAULT_CONTRACT):
+    """Regenerate the frontend ABI files from the contract's artifact"""
+    abi_json = json.dumps(load_abi(contract_name), indent=2)
+    header = f"// Generated by scripts/build.py from artifacts/{contract_name}.json - do not edit\n"
+
+    for name, content in (
+        ("abi.json", abi_json + "\n"),
+        ("abi.js", f"{header}const CONTRACT_ABI = {abi_json};\n"),
+    ):
+        if write_if_changed(os.path.join(FRONTEND_DIR, name), content):
+            print(f"   📄 frontend/{name}")
+
+
+def main():
+    """Main build function"""
+    force = "--force" in sys.argv
+    sources = [arg for arg in sys.argv[1:] if arg != "--force"]
+
+    try:
+        sources = [os.path.abspath(source) for source in sources] or find_sources()
+        print(f"🔨 Building {len(sources)} contracts...")
+
+        started = time.time()
+        index = build(sources, force=force)
+        if DEFAULT_CONTRACT in index["contracts"]:
+            write_frontend_abi()
+
+        print(f"\n🎉 Build completed in {time.time() - started:.1f}s")
+        print(f"Artifacts: {len(index['contracts'])} in {ARTIFACTS_DIR}")
+
+    except Exception as e:
+        print(f"❌ Build failed: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -9,9 +9,8 @@ import sys
 import json
 import time
 from typing import Dict, Any, Optional
-from web3 import Web3
-from eth_account import Account
-from vyper import compile_code
+
+from artifacts import contract_name_for, is_artifact_current, load_artifact
 
 # Network configurations
 NETWORKS = {
@@ -47,6 +46,10 @@ class ContractDeployer:
         if network not in NETWORKS:
             raise ValueError(f"Unsupported network: {network}")
         
+        # Imported here so usage/help output doesn't pay for web3 startup
+        from web3 import Web3
+        from eth_account import Account
+
         self.network_config = NETWORKS[network]
         self.w3 = Web3(Web3.HTTPProvider(self.network_config["rpc_url"]))
         
@@ -72,7 +75,9 @@ class ContractDeployer:
         """Compile Vyper contract"""
         try:
             print("Compiling contract...")
-            compiled = compile_code(source_code, ["abi", "bytecode"])
+            # The compiler is only needed when no current artifact exists
+            from vyper import compile_code
+            compiled = compile_code(source_code, output_formats=["abi", "bytecode"])
             print("✅ Contract compiled successfully")
             return compiled
         except Exception as e:
@@ -119,7 +124,8 @@ class ContractDeployer:
             
             # Sign and send transaction
             signed_txn = self.w3.eth.account.sign_transaction(transaction, self.account.key)
-            tx_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
+            raw_transaction = getattr(signed_txn, "raw_transaction", None) or signed_txn.rawTransaction
+            tx_hash = self.w3.eth.send_raw_transaction(raw_transaction)
             
             print(f"Transaction sent: {tx_hash.hex()}")
             print("Waiting for confirmation...")
@@ -192,7 +198,11 @@ def main():
         
         # Load and compile contract
         source_code = deployer.load_contract_source(contract_path)
-        compiled = deployer.compile_contract(source_code)
+        if is_artifact_current(contract_path):
+            print("Using precompiled artifact")
+            compiled = load_artifact(contract_name_for(contract_path))
+        else:
+            compiled = deployer.compile_contract(source_code)
         
         # Deploy contract
         contract_address = deployer.deploy_contract(
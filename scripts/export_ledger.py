@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+VyperVerse Ledger Export Script
+Stream ExpenseSplitter events into partitioned Parquet files for analytics
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+from datetime import datetime, timezone
+from typing import Dict, Any, List, Optional
+
+from artifacts import load_abi
+
+# Events exported to the ledger; their signatures come from the artifact ABI
+LEDGER_EVENTS = ["ExpenseRecorded", "PaymentReceived", "ExpenseSettled"]
+
+# Largest value that fits a decimal128(38, 0) column
+MAX_DECIMAL128 = 10**38 - 1
+
+STATE_FILE = "_export_state.json"
+
+
+def load_pyarrow():
+    """Import pyarrow lazily so the rest of the tooling works without it"""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+        return pyarrow
+    except ImportError:
+        raise ImportError("pyarrow is required for ledger export: pip install pyarrow")
+
+
+class LedgerBuffer:
+    """Column buffers for one (contract, month) partition"""
+
+    def __init__(self):
+        self.block_number = []
+        self.log_index = []
+        self.tx_hash = []
+        self.block_time = []
+        self.event = []
+        self.user = []
+        self.amount = []
+        self.amount_raw = []
+        self.description = []
+
+    def __len__(self) -> int:
+        return len(self.block_number)
+
+    def append(self, log: Dict[str, Any], event_name: str, block_time: int):
+        """Append one decoded event to the column buffers"""
+        args = log["args"]
+        amount = args["amount"]
+
+        self.block_number.append(log["blockNumber"])
+        self.log_index.append(log["logIndex"])
+        self.tx_hash.append(bytes(log["transactionHash"]))
+        # Parquet has no second-resolution timestamps, so store milliseconds
+        self.block_time.append(block_time * 1000)
+        self.event.append(event_name)
+        self.user.append(bytes.fromhex(args[event_user_field(event_name)][2:]))
+        self.amount.append(amount if amount <= MAX_DECIMAL128 else None)
+        self.amount_raw.append(amount.to_bytes(32, "big"))
+        self.description.append(args.get("description"))
+
+    def to_table(self, pa):
+        """Build a typed Arrow table from the buffered columns"""
+        schema = ledger_schema(pa)
+        columns = [
+            pa.array(self.block_number, type=pa.uint64()),
+            pa.array(self.log_index, type=pa.uint32()),
+            pa.array(self.tx_hash, type=pa.binary(32)),
+            pa.array(self.block_time, type=pa.timestamp("ms", tz="UTC")),
+            pa.array(self.event, type=pa.string()).dictionary_encode(),
+            pa.array(self.user, type=pa.binary(20)),
+            pa.array(self.amount, type=pa.decimal128(38, 0)),
+            pa.array(self.amount_raw, type=pa.binary(32)),
+            pa.array(self.description, type=pa.string()),
+        ]
+        return pa.Table.from_arrays(columns, schema=schema)
+
+
+def event_user_field(event_name: str) -> str:
+    """Name of the indexed address argument for a ledger event"""
+    return "from_user" if event_name == "PaymentReceived" else "user"
+
+
+def ledger_topics(abi: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Map each ledger event's topic hash to its name"""
+    from eth_utils import event_abi_to_log_topic
+
+    topics = {
+        "0x" + event_abi_to_log_topic(entry).hex(): entry["name"]
+        for entry in abi
+        if entry["type"] == "event" and entry["name"] in LEDGER_EVENTS
+    }
+    missing = set(LEDGER_EVENTS) - set(topics.values())
+    if missing:
+        raise ValueError(f"Contract ABI has no {', '.join(sorted(missing))} event")
+    return topics
+
+
+def ledger_schema(pa):
+    """Arrow schema shared by every ledger partition"""
+    return pa.schema([
+        ("block_number", pa.uint64()),
+        ("log_index", pa.uint32()),
+        ("tx_hash", pa.binary(32)),
+        ("block_time", pa.timestamp("ms", tz="UTC")),
+        ("event", pa.dictionary(pa.int32(), pa.string())),
+        ("user", pa.binary(20)),
+        ("amount", pa.decimal128(38, 0)),
+        ("amount_raw", pa.binary(32)),
+        ("description", pa.string()),
+    ])
+
+
+class LedgerExporter:
+    def __init__(self, rpc_url: str, output_dir: str, chunk_size: int = 2000, flush_rows: int = 50000,
+                 w3=None):
+        """Initialize the ledger exporter"""
+        # Imported here so usage/help output doesn't pay for web3 startup
+        from web3 import Web3
+
+        self.w3 = w3 or Web3(Web3.HTTPProvider(rpc_url))
+
+        if not self.w3.is_connected():
+            raise ConnectionError(f"Failed to connect to {rpc_url}")
+
+        self.pa = load_pyarrow()
+        self.output_dir = output_dir
+        self.chunk_size = chunk_size
+        self.flush_rows = flush_rows
+        self.topics = ledger_topics(load_abi())
+        self.state = self.load_state()
+
+        os.makedirs(output_dir, exist_ok=True)
+
+    def load_state(self) -> Dict[str, int]:
+        """Load the last exported block per contract"""
+        path = os.path.join(self.output_dir, STATE_FILE)
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def save_state(self):
+        """Persist the last exported block per contract"""
+        path = os.path.join(self.output_dir, STATE_FILE)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.state, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def partition_path(self, contract_address: str, month: str, first_block: int, last_block: int) -> str:
+        """Hive-style path for one Parquet part file"""
+        directory = os.path.join(
+            self.output_dir,
+            f"contract={contract_address.lower()}",
+            f"month={month}"
+        )
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, f"part-{first_block:012d}-{last_block:012d}.parquet")
+
+    def discard_uncommitted_parts(self, contract_address: str) -> int:
+        """Delete part files that start after the saved checkpoint
+
+        A crash between writing parts and saving the state leaves parts the
+        checkpoint doesn't cover; the resumed export writes those rows again.
+        """
+        committed = self.state.get(contract_address, -1)
+        pattern = os.path.join(self.output_dir, f"contract={contract_address.lower()}", "month=*", "part-*.parquet")
+
+        removed = 0
+        for path in glob.glob(pattern):
+            first_block = int(os.path.basename(path).split("-")[1])
+            if first_block > committed:
+                os.remove(path)
+                removed += 1
+        return removed
+
+    def fetch_logs(self, contract, from_block: int, to_block: int) -> List[Dict[str, Any]]:
+        """Fetch and decode ledger events for one block range"""
+        raw_logs = self.w3.eth.get_logs({
+            "address": contract.address,
+            "fromBlock": from_block,
+            "toBlock": to_block,
+            "topics": [list(self.topics.keys())]
+        })
+
+        decoded = []
+        for raw_log in raw_logs:
+            event_name = self.topics[self.w3.to_hex(raw_log["topics"][0])]
+            event = getattr(contract.events, event_name)()
+            decoded.append((event_name, event.process_log(raw_log)))
+        return decoded
+
+    def block_time(self, block_number: int, cache: Dict[int, int]) -> int:
+        """Timestamp of a block, cached for the current range"""
+        if block_number not in cache:
+            cache[block_number] = self.w3.eth.get_block(block_number)["timestamp"]
+        return cache[block_number]
+
+    def flush(self, contract_address: str, buffers: Dict[str, LedgerBuffer], first_block: int, last_block: int) -> int:
+        """Write buffered partitions to Parquet and clear them"""
+        written = 0
+        for month, buffer in buffers.items():
+            if not len(buffer):
+                continue
+            table = buffer.to_table(self.pa)
+            path = self.partition_path(contract_address, month, first_block, last_block)
+            self.pa.parquet.write_table(table, path, compression="zstd")
+            written += len(buffer)
+        buffers.clear()
+        return written
+
+    def export_contract(self, contract_address: str, start_block: int = 0, end_block: Optional[int] = None) -> int:
+        """Export new events for one contract, resuming from the saved state"""
+        contract_address = self.w3.to_checksum_address(contract_address)
+        contract = self.w3.eth.contract(address=contract_address, abi=load_abi())
+
+        if end_block is None:
+            end_block = self.w3.eth.block_number
+
+        from_block = max(start_block, self.state.get(contract_address, start_block - 1) + 1)
+        if from_block > end_block:
+            print(f"{contract_address}: up to date at block {end_block}")
+            return 0
+
+        print(f"{contract_address}: exporting blocks {from_block} to {end_block}")
+        removed = self.discard_uncommitted_parts(contract_address)
+        if removed:
+            print(f"{contract_address}: removed {removed} parts left by an interrupted export")
+
+        buffers: Dict[str, LedgerBuffer] = {}
+        buffered_rows = 0
+        flush_start = from_block
+        exported = 0
+
+        for chunk_start in range(from_block, end_block + 1, self.chunk_size):
+            chunk_end = min(chunk_start + self.chunk_size - 1, end_block)
+            block_times: Dict[int, int] = {}
+
+            for event_name, log in self.fetch_logs(contract, chunk_start, chunk_end):
+                if event_name == "ExpenseRecorded":
+                    timestamp = log["args"]["timestamp"]
+                else:
+                    timestamp = self.block_time(log["blockNumber"], block_times)
+
+                month = datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m")
+                buffers.setdefault(month, LedgerBuffer()).append(log, event_name, timestamp)
+                buffered_rows += 1
+
+            # Bound memory by flushing once enough rows are buffered
+            if buffered_rows >= self.flush_rows or chunk_end == end_block:
+                exported += self.flush(contract_address, buffers, flush_start, chunk_end)
+                self.state[contract_address] = chunk_end
+                self.save_state()
+                buffered_rows = 0
+                flush_start = chunk_end + 1
+
+        print(f"✅ {contract_address}: exported {exported} events")
+        return exported
+
+
+def main():
+    """Main export function"""
+    if len(sys.argv) < 4:
+        print("Usage: python export_ledger.py <rpc_url> <output_dir> <contract_address> [contract_address ...]")
+        sys.exit(1)
+
+    rpc_url = sys.argv[1]
+    output_dir = sys.argv[2]
+    contract_addresses = sys.argv[3:]
+
+    try:
+        exporter = LedgerExporter(rpc_url, output_dir)
+        end_block = exporter.w3.eth.block_number
+
+        started = time.time()
+        total = 0
+        for contract_address in contract_addresses:
+            total += exporter.export_contract(contract_address, end_block=end_block)
+
+        print(f"\n🎉 Export completed: {total} events in {time.time() - started:.1f}s")
+        print(f"Output: {output_dir}")
+
+    except Exception as e:
+        print(f"❌ Export failed: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
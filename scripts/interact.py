@@ -9,152 +9,21 @@ import sys
 import json
 import time
 from typing import Dict, Any, Optional
-from web3 import Web3
-from eth_account import Account
 
-# Contract ABI
-CONTRACT_ABI = [
-    {
-        "type": "event",
-        "name": "ExpenseRecorded",
-        "inputs": [
-            {"name": "user", "type": "address", "indexed": True},
-            {"name": "description", "type": "string"},
-            {"name": "amount", "type": "uint256"},
-            {"name": "timestamp", "type": "uint256"}
-        ]
-    },
-    {
-        "type": "event",
-        "name": "ParticipantAdded",
-        "inputs": [
-            {"name": "participant", "type": "address", "indexed": True},
-            {"name": "added_by", "type": "address", "indexed": True}
-        ]
-    },
-    {
-        "type": "event",
-        "name": "PaymentReceived",
-        "inputs": [
-            {"name": "from_user", "type": "address", "indexed": True},
-            {"name": "amount", "type": "uint256"}
-        ]
-    },
-    {
-        "type": "event",
-        "name": "ExpenseSettled",
-        "inputs": [
-            {"name": "user", "type": "address", "indexed": True},
-            {"name": "amount", "type": "uint256"}
-        ]
-    },
-    {
-        "type": "function",
-        "name": "get_participant_count",
-        "stateMutability": "view",
-        "inputs": [],
-        "outputs": [{"name": "", "type": "uint256"}]
-    },
-    {
-        "type": "function",
-        "name": "calculate_equal_split",
-        "stateMutability": "view",
-        "inputs": [],
-        "outputs": [{"name": "", "type": "uint256"}]
-    },
-    {
-        "type": "function",
-        "name": "get_my_balance",
-        "stateMutability": "view",
-        "inputs": [],
-        "outputs": [{"name": "", "type": "uint256"}]
-    },
-    {
-        "type": "function",
-        "name": "check_contract_balance",
-        "stateMutability": "view",
-        "inputs": [],
-        "outputs": [{"name": "", "type": "uint256"}]
-    },
-    {
-        "type": "function",
-        "name": "get_participant_at",
-        "stateMutability": "view",
-        "inputs": [{"name": "index", "type": "uint256"}],
-        "outputs": [{"name": "", "type": "address"}]
-    },
-    {
-        "type": "function",
-        "name": "is_participant",
-        "stateMutability": "view",
-        "inputs": [{"name": "check_address", "type": "address"}],
-        "outputs": [{"name": "", "type": "bool"}]
-    },
-    {
-        "type": "function",
-        "name": "total_expenses",
-        "stateMutability": "view",
-        "inputs": [],
-        "outputs": [{"name": "", "type": "uint256"}]
-    },
-    {
-        "type": "function",
-        "name": "expense_count",
-        "stateMutability": "view",
-        "inputs": [],
-        "outputs": [{"name": "", "type": "uint256"}]
-    },
-    {
-        "type": "function",
-        "name": "owner",
-        "stateMutability": "view",
-        "inputs": [],
-        "outputs": [{"name": "", "type": "address"}]
-    },
-    {
-        "type": "function",
-        "name": "record_expense",
-        "stateMutability": "nonpayable",
-        "inputs": [
-            {"name": "description", "type": "string"},
-            {"name": "amount", "type": "uint256"}
-        ],
-        "outputs": []
-    },
-    {
-        "type": "function",
-        "name": "add_participant",
-        "stateMutability": "nonpayable",
-        "inputs": [{"name": "new_participant", "type": "address"}],
-        "outputs": []
-    },
-    {
-        "type": "function",
-        "name": "contribute",
-        "stateMutability": "payable",
-        "inputs": [],
-        "outputs": []
-    },
-    {
-        "type": "function",
-        "name": "settle_expenses",
-        "stateMutability": "nonpayable",
-        "inputs": [],
-        "outputs": []
-    },
-    {
-        "type": "function",
-        "name": "emergency_withdraw",
-        "stateMutability": "nonpayable",
-        "inputs": [],
-        "outputs": []
-    }
-]
+from artifacts import load_abi
 
 class ContractInteractor:
-    def __init__(self, rpc_url: str, private_key: str, contract_address: str):
-        """Initialize the contract interactor"""
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
+    def __init__(self, rpc_url: str, private_key: str, contract_address: str, w3=None):
+        """Initialize the contract interactor
+
+        Pass an existing Web3 instance as w3 to skip creating an HTTP provider
+        (used by the test harness to run against an in-process chain).
+        """
+        # Imported here so usage/help output doesn't pay for web3 startup
+        from web3 import Web3
+        from eth_account import Account
+
+        self.w3 = w3 or Web3(Web3.HTTPProvider(rpc_url))
         
         if not self.w3.is_connected():
             raise ConnectionError(f"Failed to connect to {rpc_url}")
@@ -162,10 +31,10 @@ class ContractInteractor:
         self.account = Account.from_key(private_key)
         self.w3.eth.default_account = self.account.address
         
-        # Create contract instance
+        # Create contract instance from the precompiled artifact's ABI
         self.contract = self.w3.eth.contract(
             address=contract_address,
-            abi=CONTRACT_ABI
+            abi=load_abi()
         )
         
         print(f"Connected to contract at: {contract_address}")
@@ -186,7 +55,8 @@ class ContractInteractor:
             
             # Sign and send transaction
             signed_txn = self.w3.eth.account.sign_transaction(transaction, self.account.key)
-            tx_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
+            raw_transaction = getattr(signed_txn, "raw_transaction", None) or signed_txn.rawTransaction
+            tx_hash = self.w3.eth.send_raw_transaction(raw_transaction)
             
             print(f"Transaction sent: {tx_hash.hex()}")
             print("Waiting for confirmation...")
@@ -279,7 +149,7 @@ class ContractInteractor:
             
             for i in range(participant_count):
                 participant_address = self.call_view_function("get_participant_at", i)
-                balance = self.call_view_function("get_my_balance")
+                balance = self.call_view_function("balances", participant_address)
                 participants.append({
                     "address": participant_address,
                     "balance": balance / 10**18
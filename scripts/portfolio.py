@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+VyperVerse Portfolio Reader
+Monitor many deployed ExpenseSplitter contracts with batched, incremental reads
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+from artifacts import load_abi
+from rpc_batch import is_batch_rejection
+
+# Seconds between polls when run from the command line
+POLL_INTERVAL = 5
+
+
+def load_manifest(manifest_path: str) -> List[str]:
+    """Read contract addresses from a deployment manifest
+
+    Accepts a deploy.py output file, a list of such entries, a plain list of
+    addresses, or an object with a "contracts" list.
+    """
+    with open(manifest_path, 'r') as f:
+        manifest = json.load(f)
+
+    if isinstance(manifest, dict):
+        manifest = manifest.get("contracts", [manifest])
+
+    addresses = []
+    for entry in manifest:
+        if isinstance(entry, str):
+            addresses.append(entry)
+        else:
+            addresses.append(entry["contract_address"])
+    return addresses
+
+
+class PortfolioReader:
+    def __init__(self, rpc_url: str, addresses: List[str], max_workers: int = 16,
+                 batch_size: int = 100, provider=None):
+        """Initialize the portfolio reader"""
+        from web3 import AsyncWeb3
+
+        self.w3 = AsyncWeb3(provider or AsyncWeb3.AsyncHTTPProvider(rpc_url))
+        self.abi = load_abi()
+        self.contracts = {}
+        for address in addresses:
+            address = AsyncWeb3.to_checksum_address(address)
+            self.contracts[address] = self.w3.eth.contract(address=address, abi=self.abi)
+
+        self.batch_size = batch_size
+        self.semaphore = asyncio.Semaphore(max_workers)
+        self.supports_batching = None
+        self.last_block = None
+        self.groups: Dict[str, Dict[str, Any]] = {}
+
+    @classmethod
+    def from_manifest(cls, rpc_url: str, manifest_paths: List[str], **kwargs) -> "PortfolioReader":
+        """Create a reader for every contract listed in the manifests"""
+        addresses = []
+        for manifest_path in manifest_paths:
+            addresses.extend(load_manifest(manifest_path))
+        return cls(rpc_url, list(dict.fromkeys(addresses)), **kwargs)
+
+    async def batch(self, requests: List) -> List[Any]:
+        """Run zero-argument request factories as JSON-RPC batches
+
+        Chunks of batch_size requests run concurrently, bounded by the worker
+        semaphore. Providers that don't support or reject batches fall back to
+        concurrent single calls for the life of the reader.
+        """
+        chunks = [requests[start:start + self.batch_size] for start in range(0, len(requests), self.batch_size)]
+        results = await asyncio.gather(*(self.batch_chunk(chunk) for chunk in chunks))
+        return [result for chunk_results in results for result in chunk_results]
+
+    async def batch_chunk(self, chunk: List) -> List[Any]:
+        """Send one chunk as a single batch, or as single calls if batches are rejected
+
+        Errors on single items are raised and leave batching enabled.
+        """
+        async with self.semaphore:
+            if self.supports_batching is not False:
+                try:
+                    async with self.w3.batch_requests() as batch:
+                        for request in chunk:
+                            batch.add(request())
+                        results = await batch.async_execute()
+                    self.supports_batching = True
+                    return results
+                except Exception as e:
+                    if not is_batch_rejection(e):
+                        # The endpoint answered the batch; only an item in it failed
+                        self.supports_batching = True
+                        raise
+                    self.supports_batching = False
+
+            return await asyncio.gather(*(request() for request in chunk))
+
+    def scalar_requests(self, address: str, block: int) -> List:
+        """Request factories for one group's totals, participant count and balance"""
+        functions = self.contracts[address].functions
+        return [
+            lambda: functions.total_expenses().call(block_identifier=block),
+            lambda: functions.expense_count().call(block_identifier=block),
+            lambda: functions.get_participant_count().call(block_identifier=block),
+            lambda: self.w3.eth.get_balance(address, block_identifier=block),
+        ]
+
+    async def read_groups(self, addresses: List[str], block: int,
+                          balance_only: List[str] = ()) -> Tuple[Dict[str, Any], Dict[str, int]]:
+        """Read full state for many groups pinned at a block
+
+        Each stage is one batch across all groups: scalars, then participant
+        addresses, then participant balances. Groups in balance_only get just
+        their contract balance read in the first stage.
+        """
+        requests = [request for address in addresses for request in self.scalar_requests(address, block)]
+        requests += [
+            lambda a=address: self.w3.eth.get_balance(a, block_identifier=block)
+            for address in balance_only
+        ]
+        scalars = await self.batch(requests)
+
+        groups = {}
+        for position, address in enumerate(addresses):
+            total_expenses, expense_count, participant_count, contract_balance = scalars[4 * position:4 * position + 4]
+            groups[address] = {
+                "address": address,
+                "block": block,
+                "total_expenses": total_expenses,
+                "expense_count": expense_count,
+                "participant_count": participant_count,
+                "contract_balance": contract_balance,
+            }
+        balances_only = dict(zip(balance_only, scalars[4 * len(addresses):]))
+
+        slots = [
+            (address, i)
+            for address in addresses
+            for i in range(groups[address]["participant_count"])
+        ]
+        participants = await self.batch([
+            lambda a=address, i=i: self.contracts[a].functions.participants(i).call(block_identifier=block)
+            for address, i in slots
+        ])
+        balances = await self.batch([
+            lambda a=address, p=participant: self.contracts[a].functions.balances(p).call(block_identifier=block)
+            for (address, _), participant in zip(slots, participants)
+        ])
+
+        for group in groups.values():
+            group["participants"] = []
+        for (address, _), participant, balance in zip(slots, participants, balances):
+            groups[address]["participants"].append({"address": participant, "balance": balance})
+        for group in groups.values():
+            group["outstanding"] = sum(p["balance"] for p in group["participants"])
+
+        return groups, balances_only
+
+    async def changed_groups(self, from_block: int, to_block: int) -> Set[str]:
+        """Addresses that emitted any event in a block range"""
+        changed = set()
+        addresses = list(self.contracts)
+        for start in range(0, len(addresses), self.batch_size):
+            logs = await self.w3.eth.get_logs({
+                "address": addresses[start:start + self.batch_size],
+                "fromBlock": from_block,
+                "toBlock": to_block,
+            })
+            changed.update(self.w3.to_checksum_address(log["address"]) for log in logs)
+        return changed
+
+    async def refresh(self) -> Set[str]:
+        """Re-read groups whose events changed since the last poll
+
+        Returns the addresses whose cached state changed.
+        """
+        latest = await self.w3.eth.block_number
+        if self.last_block is not None and latest <= self.last_block:
+            return set()
+
+        if self.last_block is None:
+            dirty = list(self.contracts)
+        else:
+            changed_addresses = await self.changed_groups(self.last_block + 1, latest)
+            dirty = [address for address in self.contracts if address in changed_addresses]
+
+        # emergency_withdraw emits no event, so balances are re-read for every group
+        clean = [address for address in self.contracts if address not in dirty]
+        updated, balances = await self.read_groups(dirty, latest, balance_only=clean)
+
+        self.groups.update(updated)
+        changed = set(updated)
+        for address, balance in balances.items():
+            group = self.groups[address]
+            if group["contract_balance"] != balance:
+                group["contract_balance"] = balance
+                changed.add(address)
+            group["block"] = latest
+
+        self.last_block = latest
+        return changed
+
+    def totals(self) -> Dict[str, Any]:
+        """Aggregate figures across all cached groups"""
+        groups = self.groups.values()
+        return {
+            "groups": len(self.groups),
+            "block": self.last_block,
+            "total_expenses": sum(g["total_expenses"] for g in groups),
+            "contract_balance": sum(g["contract_balance"] for g in groups),
+            "participant_count": sum(g["participant_count"] for g in groups),
+            "outstanding": sum(g["outstanding"] for g in groups),
+        }
+
+    def print_totals(self, changed: Optional[Set[str]] = None):
+        """Print formatted portfolio totals"""
+        totals = self.totals()
+        print("\n" + "="*50)
+        print(f"PORTFOLIO @ block {totals['block']}")
+        print("="*50)
+        print(f"Groups: {totals['groups']}")
+        print(f"Total Expenses: {totals['total_expenses'] / 10**18:.4f} ETH")
+        print(f"Contract Balances: {totals['contract_balance'] / 10**18:.4f} ETH")
+        print(f"Participants: {totals['participant_count']}")
+        print(f"Outstanding: {totals['outstanding'] / 10**18:.4f} ETH")
+        if changed is not None:
+            print(f"Groups refreshed: {len(changed)}")
+        print("="*50)
+
+
+async def watch(reader: PortfolioReader, interval: float = POLL_INTERVAL):
+    """Poll the portfolio forever, printing totals after each refresh"""
+    while True:
+        started = time.time()
+        changed = await reader.refresh()
+        reader.print_totals(changed)
+        await asyncio.sleep(max(0, interval - (time.time() - started)))
+
+
+def main():
+    """Main portfolio function"""
+    if len(sys.argv) < 3:
+        print("Usage: python portfolio.py <rpc_url> <manifest.json | contract_address> [...]")
+        sys.exit(1)
+
+    rpc_url = sys.argv[1]
+    addresses = []
+    for target in sys.argv[2:]:
+        if os.path.isfile(target):
+            addresses.extend(load_manifest(target))
+        else:
+            addresses.append(target)
+
+    try:
+        reader = PortfolioReader(rpc_url, list(dict.fromkeys(addresses)))
+        asyncio.run(watch(reader))
+    except KeyboardInterrupt:
+        print("\nStopped")
+    except Exception as e:
+        print(f"❌ Portfolio monitoring failed: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
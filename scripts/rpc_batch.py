@@ -0,0 +1,27 @@
+"""
+VyperVerse RPC Batching
+Tell an endpoint that rejects JSON-RPC batches apart from errors on single batch items
+"""
+
+# JSON-RPC "invalid request" and "method not found", sent by nodes without batch support
+BATCH_REJECTION_CODES = {-32600, -32601}
+
+
+def is_batch_rejection(error: Exception) -> bool:
+    """Whether a batch failed as a whole because the endpoint doesn't take batches
+
+    Errors for single items in a batch (rate limits, missing headers) are not
+    rejections; callers should re-raise those and keep batching.
+    """
+    from web3.exceptions import BadResponseFormat, Web3RPCError, Web3TypeError
+
+    if isinstance(error, (Web3TypeError, BadResponseFormat)):
+        # Provider is not JSON-RPC based, or the reply was not a list of responses
+        return True
+    if not isinstance(error, Web3RPCError):
+        return False
+
+    response = error.rpc_response or {}
+    code = (response.get("error") or {}).get("code")
+    # A single error object with no request id answers the batch, not an item in it
+    return code in BATCH_REJECTION_CODES or response.get("id") is None
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+VyperVerse Storage Reader
+Read the full ExpenseSplitter balance table straight from storage slots
+"""
+
+import sys
+from typing import Dict, Any, List, Optional
+
+from artifacts import DEFAULT_CONTRACT, load_storage_layout
+from rpc_batch import is_batch_rejection
+
+
+def keccak(data: bytes) -> bytes:
+    from eth_utils import keccak as eth_keccak
+    return eth_keccak(data)
+
+
+def to_int(value) -> int:
+    """Integer from an RPC quantity, hex string or bytes"""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        return int(value, 16)
+    return int.from_bytes(bytes(value), "big")
+
+
+def mapping_slot(base_slot: int, key: str) -> int:
+    """Storage slot of HashMap[address, ...] entry; Vyper hashes slot ++ key"""
+    key_bytes = bytes.fromhex(key[2:]).rjust(32, b"\0")
+    return to_int(keccak(base_slot.to_bytes(32, "big") + key_bytes))
+
+
+def dynarray_slots(base_slot: int, capacity: int) -> List[int]:
+    """Length slot followed by every element slot of a DynArray of one-word items"""
+    return [base_slot + offset for offset in range(capacity + 1)]
+
+
+def verify_proof(proof: Dict[str, Any], address: str, state_root: bytes) -> Dict[int, int]:
+    """Check an eth_getProof response against a block's state root
+
+    Returns the proven slot values; raises ValueError on any mismatch.
+    """
+    try:
+        import rlp
+        from trie import HexaryTrie
+        from trie.exceptions import BadTrieProof
+    except ImportError:
+        raise ImportError("rlp and trie are required for proof verification: pip install trie")
+
+    def get_from_proof(root: bytes, key: bytes, nodes: List[bytes]) -> bytes:
+        try:
+            return HexaryTrie.get_from_proof(root, key, [rlp.decode(bytes(node)) for node in nodes])
+        except (BadTrieProof, KeyError):
+            # KeyError: the proof doesn't even contain the root node
+            raise ValueError(f"Proof does not lead to root 0x{bytes(root).hex()}")
+
+    account = get_from_proof(bytes(state_root), keccak(bytes.fromhex(address[2:])), proof["accountProof"])
+    if not account:
+        raise ValueError(f"Account {address} is not in the state trie")
+
+    storage_root = rlp.decode(account)[2]
+    if storage_root != bytes(proof["storageHash"]):
+        raise ValueError("Account proof does not match the reported storage hash")
+
+    values = {}
+    for entry in proof["storageProof"]:
+        slot = to_int(entry["key"])
+        encoded = get_from_proof(storage_root, keccak(slot.to_bytes(32, "big")), entry["proof"])
+        value = to_int(rlp.decode(encoded)) if encoded else 0
+        if value != to_int(entry["value"]):
+            raise ValueError(f"Storage proof mismatch for slot {slot}")
+        values[slot] = value
+    return values
+
+
+class StorageReader:
+    def __init__(self, rpc_url: str, contract_address: str, contract_name: str = DEFAULT_CONTRACT,
+                 batch_size: int = 200, w3=None):
+        """Initialize the storage reader from the compiler's storage layout"""
+        from web3 import Web3
+
+        self.w3 = w3 or Web3(Web3.HTTPProvider(rpc_url))
+        self.address = Web3.to_checksum_address(contract_address)
+        self.batch_size = batch_size
+        self.supports_batching = None
+
+        layout = load_storage_layout(contract_name)
+        self.balances_slot = layout["balances"]["slot"]
+        self.participants_slot = layout["participants"]["slot"]
+        self.participants_capacity = layout["participants"]["n_slots"] - 1
+
+    def pin_block(self, block: Optional[int] = None) -> int:
+        """Block number every read in a table is pinned to"""
+        return self.w3.eth.block_number if block is None else block
+
+    def read_slots(self, slots: List[int], block: int) -> List[int]:
+        """Read slots with batched eth_getStorageAt calls"""
+        values = []
+        for start in range(0, len(slots), self.batch_size):
+            chunk = slots[start:start + self.batch_size]
+
+            if self.supports_batching is not False:
+                try:
+                    with self.w3.batch_requests() as batch:
+                        for slot in chunk:
+                            batch.add(self.w3.eth.get_storage_at(self.address, slot, block))
+                        values.extend(to_int(value) for value in batch.execute())
+                    self.supports_batching = True
+                    continue
+                except Exception as e:
+                    if not is_batch_rejection(e):
+                        self.supports_batching = True
+                        raise
+                    # One request per slot from now on
+                    self.supports_batching = False
+
+            values.extend(to_int(self.w3.eth.get_storage_at(self.address, slot, block)) for slot in chunk)
+
+        return values
+
+    def participant_slots(self) -> List[int]:
+        return dynarray_slots(self.participants_slot, self.participants_capacity)
+
+    def balance_slots(self, participants: List[str]) -> List[int]:
+        return [mapping_slot(self.balances_slot, participant) for participant in participants]
+
+    def decode_participants(self, words: List[int]) -> List[str]:
+        """Addresses from the DynArray length word and element words"""
+        length = words[0]
+        return [
+            self.w3.to_checksum_address(word.to_bytes(32, "big")[12:])
+            for word in words[1:length + 1]
+        ]
+
+    def balance_table(self, block: Optional[int] = None) -> Dict[str, Any]:
+        """Every participant's balance in two batched round trips"""
+        block = self.pin_block(block)
+        participants = self.decode_participants(self.read_slots(self.participant_slots(), block))
+        balances = self.read_slots(self.balance_slots(participants), block)
+        return {
+            "block": block,
+            "balances": dict(zip(participants, balances)),
+        }
+
+    def prove_slots(self, slots: List[int], block: int, state_root: bytes) -> List[int]:
+        """Read slots with one eth_getProof call and verify them"""
+        proof = self.w3.eth.get_proof(self.address, slots, block)
+        values = verify_proof(proof, self.address, state_root)
+        missing = [slot for slot in slots if slot not in values]
+        if missing:
+            raise ValueError(f"Proof is missing {len(missing)} requested slots, first {missing[0]}")
+        return [values[slot] for slot in slots]
+
+    def proven_balance_table(self, block: Optional[int] = None,
+                             state_root: Optional[bytes] = None) -> Dict[str, Any]:
+        """Balance table with every value checked by eth_getProof
+
+        Pass a state_root for the block obtained from a source you trust (a
+        light client, a second node) to get verified values. Without it the
+        root comes from the same node's header, so the result is only
+        internally consistent: a dishonest node can fake both.
+        """
+        block = self.pin_block(block)
+        verified = state_root is not None
+        if not verified:
+            state_root = self.w3.eth.get_block(block)["stateRoot"]
+        state_root = bytes(state_root)
+
+        participants = self.decode_participants(self.prove_slots(self.participant_slots(), block, state_root))
+        balances = self.prove_slots(self.balance_slots(participants), block, state_root)
+        return {
+            "block": block,
+            "state_root": "0x" + state_root.hex(),
+            "verified": verified,
+            "balances": dict(zip(participants, balances)),
+        }
+
+
+def main():
+    """Main storage reader function"""
+    if len(sys.argv) < 3:
+        print("Usage: python storage_reader.py <rpc_url> <contract_address> "
+              "[--proof [--block <number> --state-root <trusted_root>]]")
+        sys.exit(1)
+
+    rpc_url = sys.argv[1]
+    contract_address = sys.argv[2]
+    options = sys.argv[3:]
+    with_proof = "--proof" in options
+
+    try:
+        block = int(options[options.index("--block") + 1]) if "--block" in options else None
+        state_root = bytes.fromhex(options[options.index("--state-root") + 1].removeprefix("0x")) \
+            if "--state-root" in options else None
+        if state_root is not None and (not with_proof or block is None):
+            raise ValueError("--state-root needs --proof and the --block it belongs to")
+
+        reader = StorageReader(rpc_url, contract_address)
+        table = reader.proven_balance_table(block, state_root) if with_proof else reader.balance_table(block)
+
+        label = ""
+        if with_proof:
+            label = " (verified)" if table["verified"] else " (proofs match the node's own header, not verified)"
+
+        print("\n" + "="*50)
+        print(f"BALANCES @ block {table['block']}{label}")
+        print("="*50)
+        for participant, balance in table["balances"].items():
+            print(f"{participant}: {balance / 10**18:.4f} ETH")
+        print("="*50)
+
+    except Exception as e:
+        print(f"❌ Storage read failed: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Test harness for ExpenseSplitter on an in-process EVM
+
+The contract is deployed once per test session (once per worker under
+pytest-xdist) and the chain is reverted to a snapshot after every test, so
+each test starts from the same freshly deployed state without redeploying.
+"""
+
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("web3")
+pytest.importorskip("eth_tester")
+pytest.importorskip("eth", reason="py-evm is required: pip install 'eth-tester[py-evm]'")
+
+from eth_tester import EthereumTester
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+
+from artifacts import load_artifact
+from interact import ContractInteractor
+from helpers import tester_web3
+
+
+@pytest.fixture(scope="session")
+def tester():
+    """In-process chain with pre-funded accounts"""
+    return EthereumTester()
+
+
+@pytest.fixture(scope="session")
+def w3(tester):
+    return tester_web3(tester)
+
+
+@pytest.fixture(scope="session")
+def keys(tester):
+    """Private keys of the pre-funded accounts, in account order"""
+    return [key.to_hex() for key in tester.backend.account_keys]
+
+
+@pytest.fixture(scope="session")
+def owner(w3):
+    return w3.eth.accounts[0]
+
+
+@pytest.fixture(scope="session")
+def alice(w3):
+    return w3.eth.accounts[1]
+
+
+@pytest.fixture(scope="session")
+def bob(w3):
+    return w3.eth.accounts[2]
+
+
+@pytest.fixture(scope="session")
+def outsider(w3):
+    """Funded account that is not a participant"""
+    return w3.eth.accounts[3]
+
+
+@pytest.fixture(scope="session")
+def contract(w3, owner, alice, bob):
+    """ExpenseSplitter deployed from the precompiled artifact, with alice and bob added"""
+    artifact = load_artifact()
+    factory = w3.eth.contract(abi=artifact["abi"], bytecode=artifact["bytecode"])
+    receipt = w3.eth.wait_for_transaction_receipt(factory.constructor().transact({"from": owner}))
+    deployed = w3.eth.contract(address=receipt.contractAddress, abi=artifact["abi"])
+
+    for participant in (alice, bob):
+        deployed.functions.add_participant(participant).transact({"from": owner})
+    return deployed
+
+
+@pytest.fixture(autouse=True)
+def isolate(tester, contract):
+    """Revert every state change made by a test"""
+    snapshot = tester.take_snapshot()
+    yield
+    tester.revert_to_snapshot(snapshot)
+
+
+@pytest.fixture
+def interactor_for(w3, keys, contract):
+    """Build a ContractInteractor acting as the given account index"""
+    def build(account_index: int) -> ContractInteractor:
+        return ContractInteractor(None, keys[account_index], contract.address, w3=w3)
+    return build
+
+
+@pytest.fixture
+def deploy_group(w3, owner):
+    """Deploy an extra ExpenseSplitter owned by the owner account"""
+    def deploy():
+        artifact = load_artifact()
+        factory = w3.eth.contract(abi=artifact["abi"], bytecode=artifact["bytecode"])
+        receipt = w3.eth.wait_for_transaction_receipt(factory.constructor().transact({"from": owner}))
+        return w3.eth.contract(address=receipt.contractAddress, abi=artifact["abi"])
+    return deploy
+
+
+@pytest.fixture
+def owner_interactor(interactor_for):
+    return interactor_for(0)
+
+
+@pytest.fixture
+def alice_interactor(interactor_for):
+    return interactor_for(1)
@@ -0,0 +1,111 @@
+"""Shared constants and helpers for the test suite"""
+
+from web3 import Web3, EthereumTesterProvider
+from web3.middleware import Web3Middleware
+from web3.providers import JSONBaseProvider
+from web3.providers.async_base import AsyncJSONBaseProvider
+
+ETHER = 10**18
+
+# ContractInteractor wraps a reverted transaction as "<action>: Transaction failed: ..."
+REVERTED = "Transaction failed"
+
+# What nodes without batch support send back instead of a list of responses
+BATCH_REJECTED = {
+    "jsonrpc": "2.0",
+    "id": None,
+    "error": {"code": -32600, "message": "Batch requests are not supported"},
+}
+
+# Per-item error a rate-limited node puts in an otherwise valid batch reply
+RATE_LIMITED = {"code": -32005, "message": "rate limited"}
+
+
+class StorageBlockNumberMiddleware(Web3Middleware):
+    """eth-tester only accepts integer block numbers for eth_getStorageAt"""
+
+    def request_processor(self, method, params):
+        if method == "eth_getStorageAt" and isinstance(params[2], str) and params[2].startswith("0x"):
+            params = (*params[:2], int(params[2], 16))
+        return method, params
+
+
+def tester_web3(tester) -> Web3:
+    """Web3 bound to an eth-tester chain"""
+    w3 = Web3(EthereumTesterProvider(tester))
+    w3.middleware_onion.add(StorageBlockNumberMiddleware)
+    return w3
+
+
+class BatchingTesterProvider(JSONBaseProvider):
+    """JSON-RPC provider over eth-tester that answers batch requests
+
+    Records the size of every batch it serves. With reject_batches it answers
+    each batch with a single error object, like nodes without batch support.
+    Errors appended to item_errors replace the first item of the next batches.
+    """
+
+    def __init__(self, tester, reject_batches: bool = False):
+        super().__init__()
+        self.inner = tester_web3(tester)
+        self.reject_batches = reject_batches
+        self.batch_sizes = []
+        self.item_errors = []
+
+    def make_request(self, method, params):
+        return self.inner.manager._make_request(method, params)
+
+    def make_batch_request(self, requests):
+        if self.reject_batches:
+            return BATCH_REJECTED
+        self.batch_sizes.append(len(requests))
+        responses = [
+            dict(self.make_request(method, params), id=request_id)
+            for request_id, (method, params) in enumerate(requests)
+        ]
+        if self.item_errors:
+            responses[0] = {"jsonrpc": "2.0", "id": 0, "error": self.item_errors.pop(0)}
+        return responses
+
+
+class AsyncBatchingTesterProvider(AsyncJSONBaseProvider):
+    """Async counterpart of BatchingTesterProvider"""
+
+    def __init__(self, tester, reject_batches: bool = False):
+        super().__init__()
+        self.sync = BatchingTesterProvider(tester, reject_batches)
+
+    @property
+    def batch_sizes(self):
+        return self.sync.batch_sizes
+
+    @property
+    def item_errors(self):
+        return self.sync.item_errors
+
+    async def make_request(self, method, params):
+        return self.sync.make_request(method, params)
+
+    async def make_batch_request(self, requests):
+        return self.sync.make_batch_request(requests)
+
+
+def batching_provider(tester, reject_batches: bool = False, asynchronous: bool = False):
+    """Batching provider over the harness chain, sync or async"""
+    provider_class = AsyncBatchingTesterProvider if asynchronous else BatchingTesterProvider
+    return provider_class(tester, reject_batches)
+
+
+def portfolio_reader(tester, addresses, reject_batches: bool = False, **kwargs):
+    """PortfolioReader over a batching provider; kwargs go to the reader"""
+    from portfolio import PortfolioReader
+
+    provider = batching_provider(tester, reject_batches, asynchronous=True)
+    return PortfolioReader(None, addresses, provider=provider, **kwargs)
+
+
+def storage_reader(tester, address, reject_batches: bool = False):
+    """StorageReader over a batching provider"""
+    from storage_reader import StorageReader
+
+    return StorageReader(None, address, w3=Web3(batching_provider(tester, reject_batches)))
@@ -0,0 +1,107 @@
+"""Tests for the cached read API"""
+
+import asyncio
+import json
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from api_server import create_server
+from helpers import ETHER, portfolio_reader
+
+
+@pytest.fixture
+def api(tester, contract, alice_interactor):
+    """Base URL of a running server; the updater polls only once"""
+    alice_interactor.record_expense("Dinner", 1)
+    server = create_server(portfolio_reader(tester, [contract.address]), "127.0.0.1", 0, interval=3600)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def get(url, headers=None):
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers or {}), timeout=5) as response:
+            return response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        with e:
+            return e.code, e.headers, e.read()
+
+
+def test_group_then_not_modified(api, contract):
+    _, base = api
+    url = f"{base}/groups/{contract.address}"
+
+    status, headers, body = get(url)
+    assert status == 200
+    group = json.loads(body)
+    assert group["total_expenses"] == str(ETHER)
+    assert group["participant_count"] == 3
+
+    status, not_modified_headers, body = get(url, {"If-None-Match": headers["ETag"]})
+    assert status == 304
+    assert body == b""
+    assert not_modified_headers["ETag"] == headers["ETag"]
+
+
+def test_unknown_path_is_404(api, outsider):
+    _, base = api
+
+    for path in (f"/groups/{outsider}", "/nope"):
+        assert get(base + path)[0] == 404
+
+
+def test_events_stream_updates(api):
+    server, base = api
+    with urllib.request.urlopen(f"{base}/events", timeout=5) as stream:
+        assert stream.headers["Content-Type"] == "text/event-stream"
+        server.RequestHandlerClass.cache.publish({"block": 7, "changed": []})
+
+        assert stream.readline() == b"event: update\n"
+        assert json.loads(stream.readline().removeprefix(b"data: ")) == {"block": 7, "changed": []}
+
+
+def test_quiet_group_keeps_etag_while_status_advances(api, w3, contract, owner, outsider):
+    server, base = api
+    _, headers, body = get(f"{base}/groups/{contract.address}")
+    changed_block = json.loads(body)["changed_block"]
+
+    # A block with no activity in the group
+    w3.eth.send_transaction({"from": owner, "to": outsider, "value": 1})
+    assert asyncio.run(server.updater.refresh_once())
+
+    status, _, _ = get(f"{base}/groups/{contract.address}", {"If-None-Match": headers["ETag"]})
+    assert status == 304
+    _, _, body = get(f"{base}/status")
+    assert json.loads(body)["block"] == w3.eth.block_number > changed_block
+    assert json.loads(body)["stale"] is False
+
+
+def test_failed_refresh_marks_data_stale(api, contract):
+    server, base = api
+
+    async def fail():
+        raise ConnectionError("node down")
+    server.updater.reader.refresh = fail
+    assert not asyncio.run(server.updater.refresh_once())
+
+    _, _, body = get(f"{base}/status")
+    assert json.loads(body)["stale"] is True
+    assert json.loads(body)["error"] == "node down"
+    _, _, body = get(f"{base}/groups")
+    groups = json.loads(body)
+    assert groups["status"]["stale"] is True
+    assert groups["groups"][0]["total_expenses"] == str(ETHER)
+
+
+def test_create_server_fails_when_first_refresh_fails(tester, outsider):
+    # No contract code at the address, so every call fails to decode
+    reader = portfolio_reader(tester, [outsider])
+
+    with pytest.raises(Exception, match="Initial refresh failed"):
+        create_server(reader, "127.0.0.1", 0, interval=3600, timeout=10)
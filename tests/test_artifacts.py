@@ -0,0 +1,30 @@
+"""Tests for artifact freshness checks shared by build.py and deploy.py"""
+
+import os
+
+import artifacts
+from artifacts import REPO_ROOT, is_artifact_current
+
+SOURCE = os.path.join(REPO_ROOT, "contracts", "solutions", "ExpenseSplitter_Complete.vy")
+
+
+def test_committed_artifact_is_current():
+    assert is_artifact_current(SOURCE)
+
+
+def test_edited_source_is_stale(tmp_path):
+    edited = tmp_path / os.path.basename(SOURCE)
+    with open(SOURCE, 'r') as f:
+        edited.write_text(f.read() + "\n# edited\n")
+
+    assert not is_artifact_current(str(edited))
+
+
+def test_other_compiler_is_stale(monkeypatch):
+    monkeypatch.setattr(artifacts, "compiler_version", lambda: "vyper-0.0.0")
+
+    assert not is_artifact_current(SOURCE)
+
+
+def test_missing_source_is_stale(tmp_path):
+    assert not is_artifact_current(str(tmp_path / "Missing.vy"))
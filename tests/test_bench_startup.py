@@ -0,0 +1,10 @@
+"""Startup regression checks for the command-line scripts"""
+
+import pytest
+
+from bench_startup import SCRIPTS, heavy_imports
+
+
+@pytest.mark.parametrize("script", SCRIPTS)
+def test_usage_skips_heavy_imports(script):
+    assert heavy_imports(script) == []
@@ -0,0 +1,110 @@
+"""Scenario tests for ExpenseSplitter driven through ContractInteractor"""
+
+import pytest
+
+from helpers import ETHER, REVERTED
+
+
+def test_initial_state(owner_interactor, owner):
+    info = owner_interactor.get_contract_info()
+
+    assert info["owner"] == owner
+    assert info["total_expenses"] == 0
+    assert info["expense_count"] == 0
+    assert info["participant_count"] == 3
+    assert info["contract_balance"] == 0
+
+
+def test_record_expense(alice_interactor, contract, alice):
+    alice_interactor.record_expense("Dinner", 0.3)
+
+    info = alice_interactor.get_contract_info()
+    assert info["total_expenses"] == 3 * ETHER // 10
+    assert info["expense_count"] == 1
+    assert info["my_balance"] == 3 * ETHER // 10
+    assert info["equal_split"] == ETHER // 10
+    assert contract.functions.balances(alice).call() == 3 * ETHER // 10
+
+
+def test_snapshot_isolates_tests(owner_interactor):
+    # Expenses recorded by other tests must not leak into this one
+    assert owner_interactor.call_view_function("expense_count") == 0
+
+
+def test_record_expense_rejects_zero(alice_interactor):
+    with pytest.raises(Exception, match=f"Failed to record expense: {REVERTED}"):
+        alice_interactor.record_expense("Nothing", 0)
+
+    assert alice_interactor.call_view_function("expense_count") == 0
+
+
+def test_get_participants_reports_each_balance(owner_interactor, alice_interactor, alice, bob):
+    alice_interactor.record_expense("Taxi", 1)
+
+    participants = owner_interactor.get_participants()
+
+    balances = {p["address"]: p["balance"] for p in participants}
+    assert balances[alice] == 1
+    assert balances[bob] == 0
+
+
+def test_add_participant(owner_interactor, outsider):
+    owner_interactor.add_participant(outsider)
+
+    assert owner_interactor.call_view_function("is_participant", outsider)
+    assert owner_interactor.call_view_function("get_participant_count") == 4
+
+
+def test_add_participant_owner_only(alice_interactor, outsider):
+    with pytest.raises(Exception, match=f"Failed to add participant: {REVERTED}"):
+        alice_interactor.add_participant(outsider)
+
+    assert not alice_interactor.call_view_function("is_participant", outsider)
+
+
+def test_add_participant_rejects_duplicate(owner_interactor, alice):
+    with pytest.raises(Exception, match=f"Failed to add participant: {REVERTED}"):
+        owner_interactor.add_participant(alice)
+
+    assert owner_interactor.call_view_function("get_participant_count") == 3
+
+
+def test_contribute_and_settle(w3, owner_interactor, alice_interactor, alice):
+    owner_interactor.contribute(2)
+    alice_interactor.record_expense("Hotel", 1.5)
+
+    before = w3.eth.get_balance(alice)
+    alice_interactor.settle_expenses()
+
+    assert alice_interactor.call_view_function("get_my_balance") == 0
+    assert alice_interactor.call_view_function("check_contract_balance") == ETHER // 2
+    assert w3.eth.get_balance(alice) > before
+
+
+def test_settle_requires_contract_funds(alice_interactor):
+    alice_interactor.record_expense("Flights", 5)
+
+    with pytest.raises(Exception, match=f"Failed to settle expenses: {REVERTED}"):
+        alice_interactor.settle_expenses()
+
+    assert alice_interactor.call_view_function("get_my_balance") == 5 * ETHER
+
+
+def test_settle_requires_balance(alice_interactor, owner_interactor):
+    owner_interactor.contribute(1)
+
+    with pytest.raises(Exception, match=f"Failed to settle expenses: {REVERTED}"):
+        alice_interactor.settle_expenses()
+
+    assert alice_interactor.call_view_function("check_contract_balance") == ETHER
+
+
+def test_emergency_withdraw(owner_interactor, alice_interactor):
+    alice_interactor.contribute(1)
+
+    with pytest.raises(Exception, match=f"Failed to emergency withdraw: {REVERTED}"):
+        alice_interactor.emergency_withdraw()
+    assert owner_interactor.call_view_function("check_contract_balance") == ETHER
+
+    owner_interactor.emergency_withdraw()
+    assert owner_interactor.call_view_function("check_contract_balance") == 0
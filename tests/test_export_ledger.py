@@ -0,0 +1,89 @@
+"""Tests for exporting ledger events to partitioned Parquet files"""
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+ds = pytest.importorskip("pyarrow.dataset")
+
+from export_ledger import LEDGER_EVENTS, LedgerExporter, ledger_schema, ledger_topics
+
+
+@pytest.fixture
+def exporter(w3, tmp_path):
+    return LedgerExporter(None, str(tmp_path), chunk_size=2, w3=w3)
+
+
+def read_ledger(path):
+    return ds.dataset(str(path), format="parquet", partitioning="hive").to_table().sort_by("block_number")
+
+
+def test_export_and_resume(exporter, contract, tmp_path, owner_interactor, alice_interactor, alice):
+    owner_interactor.contribute(2)
+    alice_interactor.record_expense("Dinner", 0.5)
+    alice_interactor.settle_expenses()
+
+    assert exporter.export_contract(contract.address) == 3
+    assert exporter.export_contract(contract.address) == 0
+
+    alice_interactor.record_expense("Taxi", 0.1)
+    assert exporter.export_contract(contract.address) == 1
+
+    table = read_ledger(tmp_path)
+    assert table.column("event").to_pylist() == [
+        "PaymentReceived", "ExpenseRecorded", "ExpenseSettled", "ExpenseRecorded"
+    ]
+    assert table.column("description").to_pylist() == [None, "Dinner", None, "Taxi"]
+    assert table.column("user").to_pylist()[1] == bytes.fromhex(alice[2:])
+    assert [int(a) for a in table.column("amount").to_pylist()] == [
+        2 * 10**18, 5 * 10**17, 5 * 10**17, 10**17
+    ]
+    assert table.column("amount_raw").to_pylist()[0] == (2 * 10**18).to_bytes(32, "big")
+
+
+def test_resume_state_survives_new_exporter(w3, contract, tmp_path, exporter, alice_interactor):
+    alice_interactor.record_expense("Lunch", 0.2)
+    assert exporter.export_contract(contract.address) == 1
+
+    fresh = LedgerExporter(None, str(tmp_path), w3=w3)
+    assert fresh.export_contract(contract.address) == 0
+
+
+def test_rerun_after_crash_does_not_duplicate(w3, contract, tmp_path, exporter, alice_interactor, monkeypatch):
+    alice_interactor.record_expense("Lunch", 0.2)
+    assert exporter.export_contract(contract.address) == 1
+
+    # Crash after the part files are written but before the checkpoint is saved
+    alice_interactor.record_expense("Dinner", 0.3)
+    def crash():
+        raise KeyboardInterrupt
+    monkeypatch.setattr(exporter, "save_state", crash)
+    with pytest.raises(KeyboardInterrupt):
+        exporter.export_contract(contract.address)
+
+    alice_interactor.record_expense("Taxi", 0.1)
+    fresh = LedgerExporter(None, str(tmp_path), w3=w3)
+    assert fresh.export_contract(contract.address) == 2
+
+    table = read_ledger(tmp_path)
+    assert table.column("description").to_pylist() == ["Lunch", "Dinner", "Taxi"]
+
+
+def test_partitioned_schema(exporter, contract, tmp_path, alice_interactor):
+    alice_interactor.record_expense("Hotel", 1)
+    exporter.export_contract(contract.address)
+
+    partitions = list(tmp_path.glob("contract=*/month=*/*.parquet"))
+    assert partitions
+    assert partitions[0].parent.parent.name == f"contract={contract.address.lower()}"
+
+    schema = pa.parquet.read_schema(partitions[0])
+    expected = ledger_schema(pa)
+    for field in expected:
+        assert schema.field(field.name).type == field.type
+
+
+def test_ledger_topics_match_contract_events(contract):
+    topics = ledger_topics(contract.abi)
+
+    for name in LEDGER_EVENTS:
+        assert topics[getattr(contract.events, name).topic] == name
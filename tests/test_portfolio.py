@@ -0,0 +1,112 @@
+"""Tests for batched, incremental portfolio reads"""
+
+import asyncio
+
+import pytest
+from web3.exceptions import Web3RPCError
+
+from helpers import ETHER, RATE_LIMITED, portfolio_reader
+
+
+def test_first_poll_batches_across_groups(tester, contract, deploy_group, owner, alice, bob, alice_interactor):
+    alice_interactor.record_expense("Dinner", 1)
+    groups = [contract.address, deploy_group().address, deploy_group().address]
+    reader = portfolio_reader(tester, groups)
+
+    changed = asyncio.run(reader.refresh())
+
+    assert changed == set(groups)
+    assert reader.supports_batching is True
+    # Scalars for 3 groups, then 3 + 1 + 1 participants, then their balances
+    assert reader.w3.provider.batch_sizes == [12, 5, 5]
+
+    group = reader.groups[contract.address]
+    assert [p["address"] for p in group["participants"]] == [owner, alice, bob]
+    assert group["total_expenses"] == ETHER
+    assert group["outstanding"] == sum(contract.functions.balances(p).call() for p in (owner, alice, bob))
+    assert reader.totals()["participant_count"] == 5
+
+
+def test_incremental_poll_rereads_changed_groups(tester, contract, deploy_group, alice_interactor):
+    other = deploy_group()
+    reader = portfolio_reader(tester, [contract.address, other.address])
+
+    async def scenario():
+        await reader.refresh()
+        reader.w3.provider.batch_sizes.clear()
+
+        unchanged = await reader.refresh()
+        alice_interactor.record_expense("Taxi", 0.5)
+        changed = await reader.refresh()
+        return unchanged, changed
+
+    unchanged, changed = asyncio.run(scenario())
+
+    assert unchanged == set()
+    assert changed == {contract.address}
+    # Changed group's scalars plus the other group's balance, then its 3 participants
+    assert reader.w3.provider.batch_sizes == [5, 3, 3]
+    assert reader.groups[contract.address]["expense_count"] == 1
+    assert reader.groups[contract.address]["block"] == reader.last_block
+    assert reader.groups[other.address]["block"] == reader.last_block
+
+
+def test_emergency_withdraw_detected_by_balance(tester, contract, owner_interactor):
+    reader = portfolio_reader(tester, [contract.address])
+
+    async def scenario():
+        owner_interactor.contribute(1)
+        await reader.refresh()
+        funded = reader.groups[contract.address]["contract_balance"]
+
+        owner_interactor.emergency_withdraw()
+        changed = await reader.refresh()
+        return funded, changed
+
+    funded, changed = asyncio.run(scenario())
+
+    assert funded == ETHER
+    assert changed == {contract.address}
+    assert reader.groups[contract.address]["contract_balance"] == 0
+
+
+def test_rejected_batches_fall_back_to_single_calls(tester, contract, alice_interactor, alice):
+    alice_interactor.record_expense("Tickets", 2)
+    reader = portfolio_reader(tester, [contract.address], reject_batches=True)
+
+    asyncio.run(reader.refresh())
+
+    assert reader.supports_batching is False
+    assert reader.w3.provider.batch_sizes == []
+    balances = {p["address"]: p["balance"] for p in reader.groups[contract.address]["participants"]}
+    assert balances[alice] == contract.functions.balances(alice).call()
+    assert reader.groups[contract.address]["total_expenses"] == 2 * ETHER
+
+
+def test_item_error_keeps_batching(tester, contract):
+    reader = portfolio_reader(tester, [contract.address])
+    reader.w3.provider.item_errors.append(RATE_LIMITED)
+
+    async def scenario():
+        with pytest.raises(Web3RPCError, match="rate limited"):
+            await reader.refresh()
+        assert reader.supports_batching is True
+
+        reader.w3.provider.batch_sizes.clear()
+        await reader.refresh()
+
+    asyncio.run(scenario())
+
+    assert reader.supports_batching is True
+    assert reader.w3.provider.batch_sizes == [4, 3, 3]
+    assert reader.groups[contract.address]["participant_count"] == 3
+
+
+def test_batches_respect_batch_size(tester, contract, deploy_group):
+    groups = [contract.address, deploy_group().address]
+    reader = portfolio_reader(tester, groups, batch_size=3)
+
+    asyncio.run(reader.refresh())
+
+    # 8 scalars, then 4 participants, then 4 balances, in chunks of at most 3
+    assert sorted(reader.w3.provider.batch_sizes) == [1, 1, 2, 3, 3, 3, 3]
@@ -0,0 +1,163 @@
+"""Tests for reading balances directly from storage slots"""
+
+import pytest
+
+from web3.exceptions import Web3RPCError
+
+from helpers import RATE_LIMITED, storage_reader
+from storage_reader import StorageReader, keccak, mapping_slot, verify_proof
+
+
+@pytest.fixture
+def reader(w3, contract):
+    return StorageReader(None, contract.address, w3=w3)
+
+
+def test_mapping_slot_matches_contract(reader, contract, alice_interactor, alice):
+    alice_interactor.record_expense("Lunch", 0.25)
+
+    slot = mapping_slot(reader.balances_slot, alice)
+
+    stored = int.from_bytes(reader.w3.eth.get_storage_at(contract.address, slot), "big")
+    assert stored == contract.functions.balances(alice).call()
+
+
+def test_balance_table(reader, contract, owner, alice, bob, alice_interactor, interactor_for):
+    alice_interactor.record_expense("Groceries", 1)
+    interactor_for(2).record_expense("Fuel", 2)
+
+    table = reader.balance_table()
+
+    assert table["block"] == reader.w3.eth.block_number
+    assert list(table["balances"]) == [owner, alice, bob]
+    for participant, balance in table["balances"].items():
+        assert balance == contract.functions.balances(participant).call()
+
+
+def test_balance_table_pinned_block(reader, alice, alice_interactor):
+    pinned = reader.w3.eth.block_number
+    alice_interactor.record_expense("Later", 1)
+
+    assert reader.balance_table(pinned)["balances"][alice] == 0
+
+
+def test_balance_table_batched(tester, contract, owner, alice, bob, alice_interactor):
+    alice_interactor.record_expense("Hotel", 3)
+    reader = storage_reader(tester, contract.address)
+
+    table = reader.balance_table()
+
+    assert reader.supports_batching is True
+    # Participants length word plus capacity, then one slot per participant
+    assert reader.w3.provider.batch_sizes == [reader.participants_capacity + 1, 3]
+    assert table["balances"] == {p: contract.functions.balances(p).call() for p in (owner, alice, bob)}
+
+
+def test_balance_table_rejected_batches(tester, contract, alice, alice_interactor):
+    alice_interactor.record_expense("Hotel", 3)
+    reader = storage_reader(tester, contract.address, reject_batches=True)
+
+    table = reader.balance_table()
+
+    assert reader.supports_batching is False
+    assert table["balances"][alice] == contract.functions.balances(alice).call()
+
+
+def test_balance_table_item_error_keeps_batching(tester, contract):
+    reader = storage_reader(tester, contract.address)
+    reader.w3.provider.item_errors.append(RATE_LIMITED)
+
+    with pytest.raises(Web3RPCError, match="rate limited"):
+        reader.balance_table()
+    reader.balance_table()
+
+    assert reader.supports_batching is True
+    assert reader.w3.provider.batch_sizes == [reader.participants_capacity + 1] * 2 + [3]
+
+
+def storage_proof(slots_values, address="0x" + "ab" * 20):
+    """Build an eth_getProof-shaped response from a locally built trie"""
+    rlp = pytest.importorskip("rlp")
+    trie = pytest.importorskip("trie")
+
+    storage = trie.HexaryTrie({})
+    for slot, value in slots_values.items():
+        if value:
+            storage[keccak(slot.to_bytes(32, "big"))] = rlp.encode(value)
+
+    state = trie.HexaryTrie({})
+    account_key = keccak(bytes.fromhex(address[2:]))
+    state[account_key] = rlp.encode([0, 0, storage.root_hash, keccak(b"")])
+
+    proof = {
+        "accountProof": [rlp.encode(node) for node in state.get_proof(account_key)],
+        "storageHash": storage.root_hash,
+        "storageProof": [
+            {
+                "key": slot,
+                "value": value,
+                "proof": [rlp.encode(node) for node in storage.get_proof(keccak(slot.to_bytes(32, "big")))],
+            }
+            for slot, value in slots_values.items()
+        ],
+    }
+    return proof, address, state.root_hash
+
+
+def test_verify_proof():
+    proof, address, state_root = storage_proof({11: 5, 12: 7})
+
+    assert verify_proof(proof, address, state_root) == {11: 5, 12: 7}
+
+
+def test_verify_proof_rejects_tampered_value():
+    proof, address, state_root = storage_proof({11: 5})
+    proof["storageProof"][0]["value"] = 6
+
+    with pytest.raises(ValueError):
+        verify_proof(proof, address, state_root)
+
+
+def test_prove_slots_rejects_missing_slot(reader, monkeypatch):
+    proof, _, state_root = storage_proof({11: 5}, reader.address)
+    monkeypatch.setattr(reader.w3.eth, "get_proof", lambda address, slots, block: proof)
+
+    assert reader.prove_slots([11], 1, state_root) == [5]
+    with pytest.raises(ValueError, match="missing"):
+        reader.prove_slots([11, 12], 1, state_root)
+
+
+@pytest.fixture
+def proving_node(reader, owner, monkeypatch):
+    """Serve eth_getProof for a table where the owner is owed 5 wei"""
+    storage = {slot: 0 for slot in reader.participant_slots()}
+    storage[reader.participants_slot] = 1
+    storage[reader.participants_slot + 1] = int(owner, 16)
+    storage[mapping_slot(reader.balances_slot, owner)] = 5
+    proof, _, state_root = storage_proof(storage, reader.address)
+
+    def get_proof(address, slots, block):
+        return dict(proof, storageProof=[entry for entry in proof["storageProof"] if entry["key"] in slots])
+
+    monkeypatch.setattr(reader.w3.eth, "get_proof", get_proof)
+    monkeypatch.setattr(reader.w3.eth, "get_block", lambda block: {"number": block, "stateRoot": state_root})
+    return state_root
+
+
+def test_proven_balance_table_with_trusted_root(reader, owner, proving_node):
+    table = reader.proven_balance_table(1, proving_node)
+
+    assert table["verified"] is True
+    assert table["balances"] == {owner: 5}
+
+
+def test_proven_balance_table_without_trusted_root_is_unverified(reader, owner, proving_node):
+    table = reader.proven_balance_table(1)
+
+    assert table["verified"] is False
+    assert table["balances"] == {owner: 5}
+
+
+def test_proven_balance_table_rejects_other_root(reader, proving_node):
+    with pytest.raises(ValueError):
+        reader.proven_balance_table(1, keccak(b"trusted"))